@@ -0,0 +1,20 @@
+-- Índices de SIMSEA (login por usuario, listado del panel y filtros ILIKE).
+-- Migración única: se ejecuta a mano contra la base, no desde la app.
+--
+--   psql "host=$DB_HOST port=$DB_PORT dbname=$DB_NAME user=$DB_USER sslmode=require" -f migrations/001_indices.sql
+--
+-- psql ejecuta cada sentencia en autocommit, así que CONCURRENTLY funciona y las tablas
+-- siguen aceptando escrituras mientras se construyen los índices. Es idempotente (IF NOT EXISTS).
+-- Si un CREATE ... CONCURRENTLY falla, deja el índice INVALID: borrarlo (DROP INDEX) y volver a correr.
+
+-- login: búsqueda por username (falla si ya hay usuarios duplicados; depurarlos antes)
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS users_username_idx ON users (username);
+
+-- panel y exportación: ORDER BY created_at DESC y filtro por país
+CREATE INDEX CONCURRENTLY IF NOT EXISTS projects_created_at_idx ON projects (created_at DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS projects_pais_idx ON projects (pais_intervencion);
+
+-- filtros ILIKE '%texto%' del panel: índices de trigramas
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS projects_usuario_trgm_idx ON projects USING gin (usuario gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS projects_pueblo_trgm_idx ON projects USING gin (pueblo_nacionalidad gin_trgm_ops);